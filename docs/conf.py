@@ -6,12 +6,6 @@ list see the documentation:
 https://www.sphinx-doc.org/en/master/usage/configuration.html
 """
 
-# -- Path setup --------------------------------------------------------------
-import sys
-from sphinx.util.inspect import getdoc
-from sphinx.util.docstrings import separate_metadata
-sys.path.extend(['../src'])
-
 # -- Project information -----------------------------------------------------
 
 project = 'energomera-hass-mqtt'
@@ -20,12 +14,13 @@ author = 'Ilia Sotnikov'
 
 
 extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.autosummary',
+    'autoapi.extension',
     'sphinx.ext.intersphinx',
     'sphinx.ext.autosectionlabel',
-    'sphinx_autodoc_typehints',
 ]
+# Pages generated by `autoapi` share section titles (e.g. "Module Contents"),
+# so prefix the labels with document name to keep them unique
+autosectionlabel_prefix_document = True
 
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
@@ -37,13 +32,17 @@ exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 #
 html_theme = 'sphinx_rtd_theme'
 
-autodoc_default_options = {
-    'members': True,
-    'inherited-members': True,
-    'show-inheritance': True,
-    'member-order': 'bysource',
-    'class-doc-from': 'both',
-}
+# API documentation is generated from the sources parsed statically, so the
+# package (and its runtime dependencies) need not to be importable
+autoapi_dirs = ['../src']
+autoapi_options = [
+    'members',
+    'show-inheritance',
+]
+autoapi_member_order = 'bysource'
+autoapi_python_class_content = 'both'
+# The API documentation is linked from `api-docs.rst`
+autoapi_add_toctree_entry = False
 
 source_suffix = {
     '.rst': 'restructuredtext',
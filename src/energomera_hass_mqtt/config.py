@@ -23,9 +23,8 @@ Module to instantiate configuration data for :class:`EnergomeraHassMqtt` class
 from YAML files with defaults and schema validation.
 """
 from __future__ import annotations
-from typing import Optional, cast
+from typing import Callable, Dict, List, Optional, Tuple, Union, cast
 from datetime import date
-from copy import deepcopy
 import re
 from re import Match
 from dateutil.relativedelta import relativedelta
@@ -35,6 +34,22 @@ from .schema import ConfigSchema, ConfigParameterSchema
 from .const import DEFAULT_CONFIG_PARAMETERS, LOGGING_LEVELS
 from .exceptions import EnergomeraConfigError
 
+# Use YAML loader implemented in C (from `libyaml`) if available, since it is
+# way faster than the pure Python one
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Interpolation expressions supported in ``parameters`` section of the
+# configuration, matched by single regex (so each value is scanned once) -
+# the first group is the expression name, and the last one is its argument
+_ENERGOMERA_EXPR_RE = re.compile(
+    r'{{\s*energomera_(prev_month|prev_day)\s*(.*?)\s*}}'
+)
+
+# Default parameters, validated once. Configuration instances get copies of
+# those, since interpolation modifies parameters in place
+_DEFAULT_PARAMETERS = tuple(
+    ConfigParameterSchema.model_validate(x) for x in DEFAULT_CONFIG_PARAMETERS
+)
+
 
 class EnergomeraConfig:
     """
@@ -50,7 +65,7 @@ class EnergomeraConfig:
     ) -> int:
         """
         Static method to be used with ``re.sub()`` as callable processing the
-        first match group as the argument to interpolation expression.
+        last match group as the argument to interpolation expression.
 
         :param match: Match object provided by ``re.sub``
         :param default: Default value for the argument
@@ -60,14 +75,16 @@ class EnergomeraConfig:
         # called directly with no re.Match instance provided
         assert match is not None
 
-        try:
-            expr = match.group(0)
-            arg = match.group(1)
-        except IndexError:
-            # Match having no groups results in default value, likely the regex
-            # has no such
+        # Match having no groups results in default value, likely the regex
+        # has no such
+        groups_num = match.re.groups
+        if not groups_num:
             return default
 
+        expr = match.group(0)
+        # Argument is the last group of the regex
+        arg = match.group(groups_num)
+
         # Empty argument results in default value
         if not arg:
             return default
@@ -94,42 +111,49 @@ class EnergomeraConfig:
             ) from exc
 
     @staticmethod
-    def _energomera_prev_month(match: Match[str]) -> str:
+    def _energomera_prev_month(match: Match[str], today: date) -> str:
         """
         Static method to calculate previous month in meter's format.
 
+        :param match: Match object for the expression
+        :param today: Date to calculate previous month relative to
         :return: Previous month formatted as ``<month number>.<year>``
         """
 
         months = EnergomeraConfig._energomera_re_expr_param_int(match, 1)
         return (
-            (date.today() - relativedelta(months=months))
+            (today - relativedelta(months=months))
             .strftime('%m.%y')
         )
 
     @staticmethod
-    def _energomera_prev_day(match: Match[str]) -> str:
+    def _energomera_prev_day(match: Match[str], today: date) -> str:
         """
         Static method to calculate previous day in meter's format.
 
+        :param match: Match object for the expression
+        :param today: Date to calculate previous day relative to
         :return: Previous day formatted as ``<day number>.<month
           number>.<year>``
         """
         days = EnergomeraConfig._energomera_re_expr_param_int(match, 1)
         return (
-            (date.today() - relativedelta(days=days))
+            (today - relativedelta(days=days))
             .strftime('%d.%m.%y')
         )
 
     @staticmethod
-    def _read_config(config_file: str) -> str:
+    def _read_config(config_file: str) -> bytes:
         """
         Reads configuration file.
 
+        The contents is returned undecoded, leaving that to YAML parser
+        (detects the encoding as per YAML specification).
+
         :param config_file: Name of configuration file
         :return: Configuration file contents
         """
-        with open(config_file, encoding='ascii') as file:
+        with open(config_file, 'rb') as file:
             content = file.read()
 
         return content
@@ -149,12 +173,15 @@ class EnergomeraConfig:
             )
 
         try:
-            if not content:
+            source: Union[str, bytes]
+            if content:
+                source = content
+            else:
                 # Cast the configure file name, since the check above ensures
                 # it is defined
-                content = self._read_config(cast(str, config_file))
+                source = self._read_config(cast(str, config_file))
 
-            config = yaml.safe_load(content)
+            config = yaml.load(source, Loader=_YamlSafeLoader)
         except (yaml.YAMLError, OSError) as exc:
             raise EnergomeraConfigError(
                 f'Error loading configuration file:\n{str(exc)}'
@@ -176,15 +203,22 @@ class EnergomeraConfig:
         # defined in the configuration file, no check for duplicates is
         # performed!
         if self._config.general.include_default_parameters:
-            self._config.parameters = (
-                [
-                    ConfigParameterSchema.model_validate(x)
-                    for x in DEFAULT_CONFIG_PARAMETERS
-                ] + self._config.parameters
-            )
-        # Make a copy of the original configuration for the `interpolate()`
-        # method to access initially defined interpolation expressions if any
-        self._orig_config = deepcopy(self._config)
+            self._config.parameters[0:0] = [
+                x.model_copy() for x in _DEFAULT_PARAMETERS
+            ]
+        # Keep the original values containing interpolation expressions, as
+        # index of the parameter, name of its field and the value, for the
+        # `interpolate()` method to access those. Other values stay intact
+        # upon interpolation, so there is no need to keep a copy of whole
+        # configuration
+        self._interpolation_templates: List[Tuple[int, str, str]] = []
+        for idx, param in enumerate(self._config.parameters):
+            # Access the fields directly rather than dumping the model into
+            # a dictionary
+            for key in ConfigParameterSchema.model_fields:
+                value = getattr(param, key)
+                if isinstance(value, str) and '{{' in value:
+                    self._interpolation_templates.append((idx, key, value))
 
     @property
     def of(self) -> ConfigSchema:
@@ -208,26 +242,50 @@ class EnergomeraConfig:
     def interpolate(self) -> None:
         """
         Interpolates certain expressions in ``parameters`` section of the
-        configuration. The method uses original configuration as read from the
+        configuration. The method uses original values as read from the
         source, to access expressions to interpolate.
 
         Supported expressions:
 
         - ``{{ energomera_prev_month }}``: Previous month in meter's format
         - ``{{ energomera_prev_day }}``: Previous day in meter's format
+
+        Parameters having interpolated values changed are replaced with new
+        instances.
         """
-        # Iterate over the original configuration
-        for idx, param in enumerate(self._orig_config.parameters):
-            for key, value in param.model_dump().items():
-                # Interpolate expressions in string values
-                if isinstance(value, str):
-                    value = re.sub(r'{{\s*energomera_prev_month\s*(.*?)\s*}}',
-                                   self._energomera_prev_month, value)
-                    value = re.sub(r'{{\s*energomera_prev_day\s*(.*?)\s*}}',
-                                   self._energomera_prev_day, value)
-                    # Store the (possibly) interpolated value to the
-                    # configuration exposed to the consumers
-                    setattr(self._config.parameters[idx], key, value)
+        # Functions to interpolate the expressions by their names
+        expr_funcs: Dict[str, Callable[[Match[str], date], str]] = {
+            'prev_month': self._energomera_prev_month,
+            'prev_day': self._energomera_prev_day,
+        }
+        # Results of expressions interpolated so far, so that the same
+        # expression used by multiple parameters is calculated only once per
+        # call
+        interpolated: Dict[str, str] = {}
+        # All expressions are calculated relative to the same date, even if
+        # the call happens to span midnight
+        today = date.today()
+
+        def interpolate_expr(match: Match[str]) -> str:
+            expr = match.group(0)
+            if expr not in interpolated:
+                interpolated[expr] = expr_funcs[match.group(1)](
+                    match, today
+                )
+            return interpolated[expr]
+
+        # Iterate over the original values having expressions
+        parameters = self._config.parameters
+        for idx, key, value in self._interpolation_templates:
+            value = _ENERGOMERA_EXPR_RE.sub(interpolate_expr, value)
+            # Store the interpolated value to the configuration exposed to
+            # the consumers. The parameter is replaced with the updated copy
+            # rather than modified in place, so that consumers holding the
+            # parameter could tell it has changed just by its identity
+            if getattr(parameters[idx], key) != value:
+                parameters[idx] = parameters[idx].model_copy(
+                    update={key: value}
+                )
 
     def __repr__(self) -> str:
         """
@@ -22,15 +22,17 @@
 Module to hold various constants
 """
 import logging
+from types import MappingProxyType
 DEFAULT_CONFIG_FILE = '/etc/energomera/config.yaml'
 
-LOGGING_LEVELS = dict(
+# Read-only mapping of logging level names to their values
+LOGGING_LEVELS = MappingProxyType(dict(
     critical=logging.CRITICAL,
     error=logging.ERROR,
     warning=logging.WARNING,
     info=logging.INFO,
     debug=logging.DEBUG,
-)
+))
 # Default parameters to use when configuration file has none
 DEFAULT_CONFIG_GENERAL_ONESHOT = False
 DEFAULT_CONFIG_GENERAL_INTERCYCLE_DELAY = 30
@@ -49,7 +51,11 @@ DEFAULT_CONFIG_METER_TIMEOUT = 30
 DEFAULT_CONFIG_MQTT_PORT = 1883
 DEFAULT_CONFIG_MQTT_TLS = True
 
-DEFAULT_CONFIG_PARAMETERS = [
+# Template for HASS to extract sensor value from its state payload
+HASS_VALUE_TEMPLATE = '{{ value_json.value }}'
+
+# Frozen, since these are shared by all configuration instances
+DEFAULT_CONFIG_PARAMETERS = tuple(MappingProxyType(x) for x in (
     dict(
         address='ET0PE',
         name='Cumulative energy',
@@ -101,11 +107,11 @@ DEFAULT_CONFIG_PARAMETERS = [
     ),
     dict(
         address='POWPP',
-        name=[
+        name=(
             'Active energy, phase A',
             'Active energy, phase B',
             'Active energy, phase C'
-        ],
+        ),
         device_class='power',
         state_class='measurement',
         unit='kW',
@@ -125,11 +131,11 @@ DEFAULT_CONFIG_PARAMETERS = [
     ),
     dict(
         address='VOLTA',
-        name=[
+        name=(
             'Voltage, phase A',
             'Voltage, phase B',
             'Voltage, phase C'
-        ],
+        ),
         device_class='voltage',
         state_class='measurement',
         unit='V',
@@ -149,11 +155,11 @@ DEFAULT_CONFIG_PARAMETERS = [
     ),
     dict(
         address='CURRE',
-        name=[
+        name=(
             'Current, phase A',
             'Current, phase B',
             'Current, phase C'
-        ],
+        ),
         device_class='current',
         state_class='measurement',
         unit='A',
@@ -171,4 +177,4 @@ DEFAULT_CONFIG_PARAMETERS = [
         additional_data=None,
         entity_name=None
     ),
-]
+))
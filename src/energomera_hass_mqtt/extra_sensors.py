@@ -33,8 +33,12 @@ class PseudoSensor(IecToHassSensor, Generic[T]):
     """
     Represents a pseudo-sensor, i.e. one doesn't exist on meter.
     """
+    __slots__ = ('_state_last_will_payload',)
+
     def __init__(self, value: T, *args: Any, **kwargs: Any):
-        self._state_last_will_payload: Optional[T] = None
+        # Last will payload is stored formatted, since it is accessed on
+        # every processing of the sensor
+        self._state_last_will_payload: Optional[str] = None
         # Invoke the parent constructor providing `iec_item` from the
         # pseudo-sensor value
         kwargs['iec_item'] = [
@@ -65,15 +69,16 @@ class PseudoSensor(IecToHassSensor, Generic[T]):
 
         :param value: Value for last will payload
         """
-        return PseudoSensor._format_value(self._state_last_will_payload)
+        return self._state_last_will_payload
 
     @state_last_will_payload.setter
     def state_last_will_payload(self, value: T) -> None:
-        self._state_last_will_payload = value
+        self._state_last_will_payload = PseudoSensor._format_value(value)
 
 
 class PseudoBinarySensor(PseudoSensor[bool]):
     """
     Represents a binary pseudo-sensor.
     """
+    __slots__ = ()
     _mqtt_topic_base = 'binary_sensor'
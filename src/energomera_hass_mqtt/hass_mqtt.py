@@ -25,6 +25,9 @@ HomeAssistant using MQTT.
 from __future__ import annotations
 from typing import Optional, TYPE_CHECKING, cast, List
 import logging
+import asyncio
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import ssl
 from os import getenv
 from time import time
@@ -44,6 +47,41 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _iec_read_request(
+    address: str, additional_data: Optional[str] = None
+) -> bytes:
+    """
+    Builds IEC 62056-21 request to read value(s) at selected address. The
+    request only depends on the arguments, so it is cached - with bounded
+    size, since interpolated additional data changes over time and would
+    otherwise accumulate entries indefinitely.
+
+    :param address: Address of meter parameter to read
+    :param additional_data: Additional data to read the parameter with
+    :return: The request to send to the meter
+    """
+    request = CommandMessage.for_single_read(address, additional_data)
+    return cast(bytes, request.to_bytes())
+
+
+def _log_process_failure(task: asyncio.Task[None]) -> None:
+    """
+    Logs the failure of the task processing HASS sensor, as soon as the task
+    completes rather than once all sensors of the meter cycle are processed.
+
+    :param task: The task completed
+    """
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        _LOGGER.error(
+            'Got exception while processing HASS sensor: %s', exc,
+            exc_info=exc
+        )
+
+
 # pylint: disable=too-many-instance-attributes
 class EnergomeraHassMqtt:
     """
@@ -66,11 +104,10 @@ class EnergomeraHassMqtt:
         :param bytes_data: The data to calculate BCC over
         :return: Calculated BCC
         """
-        bcc = 0
-        for elem in bytes_data:
-            bcc += elem
-            bcc = bcc & 0xFF
-        bcc = bcc & 0x7F
+        # The algorithm sums the bytes modulo 256 and then takes the lower 7
+        # bits of the result, the latter makes masking intermediate sums
+        # redundant - hence summing the whole data at once
+        bcc = sum(bytes_data) & 0x7F
         return bcc.to_bytes(length=1, byteorder='big')
 
     def __init__(
@@ -78,10 +115,6 @@ class EnergomeraHassMqtt:
     ):
         self._config = config
         self._dry_run = dry_run
-        # Override the method in the `iec62056_21` library with the specific
-        # implementation
-        # pylint: disable=protected-access
-        utils._calculate_bcc = EnergomeraHassMqtt.calculate_bcc
 
         # Currently `Iec6205621Client.with_serial_transport()` method doesn't
         # accept timeout, so instantiate the IEC client with explicit transport
@@ -93,12 +126,23 @@ class EnergomeraHassMqtt:
                 timeout=config.of.meter.timeout
             )
         )
+        # Serial I/O is blocking, so it is performed in the executor. Single
+        # worker ensures the I/O is done sequentially, including disconnecting
+        # from the meter only once the I/O in flight completes, e.g. if the
+        # meter cycle has been cancelled while reading from the meter
+        self._serial_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='energomera-serial'
+        )
 
         mqtt_tls_context = None
         if config.of.mqtt.tls:
             _LOGGER.debug('Enabling TLS for MQTT connection')
             # Required for TLS-enabled MQTT broker
-            mqtt_tls_context = ssl.SSLContext()
+            mqtt_tls_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            # The broker certificate isn't verified, the same way the
+            # `ssl.SSLContext()` (deprecated with no protocol specified) did
+            mqtt_tls_context.check_hostname = False
+            mqtt_tls_context.verify_mode = ssl.CERT_NONE
 
         self._mqtt_client = MqttClient(
             dry_run=self._dry_run,
@@ -125,28 +169,53 @@ class EnergomeraHassMqtt:
         self._model = None
         self._serial_number = None
         self._sw_version = None
+        # HASS sensors for the parameters requested, instantiated once meter
+        # identification is known and reused across meter cycles
+        self._hass_items: List[IecToHassSensor] = []
+
+    def iec_open_session(self) -> None:
+        """
+        Opens the session with the meter, the method performs blocking serial
+        I/O.
+        """
+        _LOGGER.debug('Opening connection with meter')
+        self._client.connect()
+        self._client.startup()
+        # Start the session in programming mode since it is faster one, as
+        # it switches to baud rate higher than initial (300 baud, as per
+        # IEC 62056-21, mode C). Requires password to be provided when
+        # constructing the instance of the class
+        _LOGGER.debug('Entering programming mode with meter')
+        self._client.ack_with_option_select("programming")
+        self._client.read_response()
+        self._client.send_password()
+        self._client.read_response()
 
-        # (re)initialize what configuration payloads have been sent across all
-        # instances of `IecToHassSensor`. Mostly used by tests, as
-        # `async_main()` instantiates the class only once
-        IecToHassSensor.hass_config_payloads_published = {}
+    def iec_disconnect(self) -> None:
+        """
+        Disconnects from the meter ignoring possible exceptions - it might
+        have not been connected yet, the method performs blocking serial I/O.
+        """
+        try:
+            self._client.disconnect()
+        except Exception:  # pylint: disable=broad-except
+            pass
 
     def iec_read_values(
         self, address: str, additional_data: Optional[str] = None
     ) -> List[IecDataSet]:
         """
         Reads value(s) at selected address from the meter using IEC 62056-21
-        protocol.
+        protocol, the method performs blocking serial I/O.
 
         :param address: Address of meter parameter to read
         :param additional_data: Additional data to read the parameter with
          (argument to parameter's address)
         :return: Parameter's data received from the meter
         """
-        request = CommandMessage.for_single_read(
-            address, additional_data
+        self._client.transport.send(
+            _iec_read_request(address, additional_data)
         )
-        self._client.transport.send(request.to_bytes())
 
         # `iec62056_21` library doesn't provide typiing hints for the response,
         # so cast it explicitly
@@ -162,8 +231,15 @@ class EnergomeraHassMqtt:
             raise ValueError(
                 'Failed to retrieve meter identification data'
             )
-        [_, self._model, self._sw_version, self._serial_number, _
-         ] = hello_response[0].value.split(',')
+        meter_ids = (self._model, self._sw_version, self._serial_number)
+        # Meter identification occupies 2nd to 4th fields of the response,
+        # the trailing ones are left unsplit
+        (_, self._model, self._sw_version, self._serial_number, _
+         ) = hello_response[0].value.split(',', 4)
+        # HASS sensors depend on meter identification, so need to be
+        # instantiated again once it changes
+        if meter_ids != (self._model, self._sw_version, self._serial_number):
+            self._hass_items = []
 
         _LOGGER.debug(
             "Retrieved identification data from meter:"
@@ -175,28 +251,48 @@ class EnergomeraHassMqtt:
                 'Failed to retrieve meter identification data'
             )
 
+    def hass_item_for_param(
+        self, param: ConfigParameterSchema
+    ) -> IecToHassSensor:
+        """
+        Instantiates HASS sensor for the configuration parameter, using the
+        meter identification known.
+
+        :param param: Configuration parameter to instantiate the sensor for
+        :return: HASS sensor instance
+        """
+        return IecToHassSensor(
+            mqtt_config=self._config.of.mqtt,
+            mqtt_client=self._mqtt_client, config_param=param,
+            iec_item=[],
+            # `set_meter_ids()` ensures these values are defined, so cast
+            # them dropping `Optional` type
+            model=cast(str, self._model),
+            sw_version=cast(str, self._sw_version),
+            serial_number=cast(str, self._serial_number)
+        )
+
     async def iec_read_admin(self) -> None:
         """
         Primary method to loop over the parameters requested and process them.
         """
 
         start = time()
+        loop = asyncio.get_running_loop()
         try:
-            _LOGGER.debug('Opening connection with meter')
-            self._client.connect()
-            self._client.startup()
-            # Start the session in programming mode since it is faster one, as
-            # it switches to baud rate higher than initial (300 baud, as per
-            # IEC 62056-21, mode C). Requires password to be provided when
-            # constructing the instance of the class
-            _LOGGER.debug('Entering programming mode with meter')
-            self._client.ack_with_option_select("programming")
-            self._client.read_response()
-            self._client.send_password()
-            self._client.read_response()
-
-            # Read meter identification (mode, SW version, serial number)
-            self.set_meter_ids(self.iec_read_values('HELLO'))
+            # Serial I/O is blocking, so run it in the executor, same as
+            # reading values from the meter
+            await loop.run_in_executor(
+                self._serial_executor, self.iec_open_session
+            )
+
+            # Read meter identification (mode, SW version, serial number) on
+            # every cycle, so that replacing the meter in between is noticed
+            self.set_meter_ids(
+                await loop.run_in_executor(
+                    self._serial_executor, self.iec_read_values, 'HELLO'
+                )
+            )
 
             # This call will set last will only, which has to be done prior to
             # connecting to the broker
@@ -204,27 +300,60 @@ class EnergomeraHassMqtt:
             # The connection to MQTT broker is instantiated only once, if not
             # connected previously.
             await self._mqtt_client.connect()
-            # Process parameters requested
-            for param in self._config.of.parameters:
-                iec_item = self.iec_read_values(
-                    param.address, param.additional_data
-                )
+            # Instantiate HASS sensors for the parameters requested, once per
+            # meter identification
+            if not self._hass_items:
+                self._hass_items = [
+                    self.hass_item_for_param(param)
+                    for param in self._config.of.parameters
+                ]
 
-                hass_item = IecToHassSensor(
-                    mqtt_config=self._config.of.mqtt,
-                    mqtt_client=self._mqtt_client, config_param=param,
-                    iec_item=iec_item,
-                    # `set_meter_ids()` ensures these values are defined, so
-                    # cast them dropping `Optional` type
-                    model=cast(str, self._model),
-                    sw_version=cast(str, self._sw_version),
-                    serial_number=cast(str, self._serial_number)
-                )
-                await hass_item.process()
+            # Process parameters requested. Sending those over to MQTT is done
+            # by tasks running concurrently, so that publishes for different
+            # sensors don't wait for each other, and overlap with reading
+            # subsequent parameters from the meter
+            process_tasks: List[asyncio.Task[None]] = []
+            try:
+                for idx, param in enumerate(self._config.of.parameters):
+                    hass_item = self._hass_items[idx]
+                    # `EnergomeraConfig.interpolate()` replaces the parameters
+                    # it changes with new instances, instantiate the HASS
+                    # sensor again for those
+                    if hass_item.config_param is not param:
+                        hass_item = self.hass_item_for_param(param)
+                        self._hass_items[idx] = hass_item
+                    # Serial I/O is blocking, so run it in the executor to let
+                    # the tasks sending previously read values to MQTT proceed
+                    # in the meantime
+                    hass_item.iec_item = await loop.run_in_executor(
+                        self._serial_executor, self.iec_read_values,
+                        param.address, param.additional_data
+                    )
+                    # Nothing to send to HASS if the meter provided no data
+                    # for the parameter. That is logged at debug level only,
+                    # since it would likely repeat on every cycle
+                    if not hass_item.iec_item:
+                        _LOGGER.debug(
+                            "No data received from meter for IEC entry at"
+                            " '%s', skipping", param.address
+                        )
+                        continue
+                    process_task = asyncio.create_task(hass_item.process())
+                    process_task.add_done_callback(_log_process_failure)
+                    process_tasks.append(process_task)
 
-            # End the session
-            _LOGGER.debug('Closing session with meter')
-            self._client.send_break()
+                # End the session
+                _LOGGER.debug('Closing session with meter')
+                await loop.run_in_executor(
+                    self._serial_executor, self._client.send_break
+                )
+            finally:
+                # Wait for sensors to be processed, including the case of
+                # reading from the meter has been interrupted. Failures of the
+                # tasks are logged by `_log_process_failure()` and not raised
+                # here, so they don't replace the exception the reading has
+                # been interrupted with, if any
+                await asyncio.gather(*process_tasks, return_exceptions=True)
         except TimeoutError as exc:
             await self.set_online_sensor(False)
             raise exc
@@ -233,23 +362,26 @@ class EnergomeraHassMqtt:
             duration = time() - start
             await self.set_duration_sensor(duration)
         finally:
-            # Disconnect serial client ignoring possible
-            # exceptions - it might have not been connected yet
-            try:
-                self._client.disconnect()
-            except Exception:  # pylint: disable=broad-except
-                pass
+            # Disconnect serial client in the executor, so that it happens
+            # after the serial I/O in flight. The disconnect is shielded to
+            # complete even if the meter cycle gets cancelled while waiting
+            await asyncio.shield(
+                loop.run_in_executor(
+                    self._serial_executor, self.iec_disconnect
+                )
+            )
 
     async def finalize(self) -> None:
         """
         Performs finalization steps, that is - disconnecting MQTT client
-        currently.
+        and shutting down the executor used for serial I/O.
         """
         try:
             await self.set_online_sensor(False)
             await self._mqtt_client.disconnect()
         except Exception:  # pylint: disable=broad-except
             pass
+        self._serial_executor.shutdown()
 
     async def set_online_sensor(
         self, state: bool, setup_only: bool = False
@@ -306,3 +438,10 @@ class EnergomeraHassMqtt:
             serial_number=self._serial_number
         )
         await hass_item.process()
+
+
+# Override the method in the `iec62056_21` library with the specific
+# implementation, once the module is imported
+utils._calculate_bcc = (  # pylint: disable=protected-access
+    EnergomeraHassMqtt.calculate_bcc
+)
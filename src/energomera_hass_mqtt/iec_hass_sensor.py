@@ -24,10 +24,11 @@ protocol.
 """
 from __future__ import annotations
 from typing import (
-    Dict, TYPE_CHECKING, Optional, Union, Collection, List
+    Dict, TYPE_CHECKING, Optional, Union, Collection, List, Tuple
 )
 import json
 import logging
+from .const import HASS_VALUE_TEMPLATE
 if TYPE_CHECKING:
     from .schema import ConfigMqttSchema, ConfigParameterSchema
     from .mqtt_client import MqttClient
@@ -57,6 +58,15 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
     hass_config_payloads_published: Dict[str, int] = {}
     # Class attribute defining MQTT topic base for HASS discovery
     _mqtt_topic_base = 'sensor'
+    # Instances are kept across meter cycles, one per parameter requested, so
+    # avoid per-instance `__dict__`
+    __slots__ = (
+        '_config_param', '_iec_item', '_mqtt_config', '_mqtt_client',
+        '_hass_item_name', '_hass_device_id', '_hass_device',
+        '_hass_topic_prefix', '_hass_unique_id', '_hass_config_topic',
+        '_hass_state_topic', '_hass_props_cache',
+        '_hass_json_config_payload_cache',
+    )
 
     def __init__(  # pylint: disable=too-many-arguments
         self, mqtt_config: ConfigMqttSchema, mqtt_client: MqttClient,
@@ -68,13 +78,34 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
         self._mqtt_config = mqtt_config
         self._mqtt_client = mqtt_client
         self._hass_item_name: Optional[str] = None
-        self._hass_device_id: Optional[str] = None
+        # HASS device ID and description only depend on meter
+        # identification, so are calculated once
+        self._hass_device_id = f'{model}_{serial_number}'
+        self._hass_device = dict(
+            name=serial_number,
+            ids=self._hass_device_id,
+            model=model,
+            sw_version=sw_version,
+        )
+        # Same for the leading part of MQTT topics, prepending HASS discovery
+        # prefix if configured
+        self._hass_topic_prefix = (
+            f'{mqtt_config.hass_discovery_prefix}/{self._mqtt_topic_base}'
+            if mqtt_config.hass_discovery_prefix else self._mqtt_topic_base
+        ) + f'/{self._hass_device_id}'
         self._hass_unique_id: Optional[str] = None
         self._hass_config_topic: Optional[str] = None
         self._hass_state_topic: Optional[str] = None
-        self._model = model
-        self._sw_version = sw_version
-        self._serial_number = serial_number
+        # HASS sensor properties (name, unique ID, config and state MQTT
+        # topics) and JSON formatted config payload, keyed by entry index and
+        # whether meter's response has multiple entries. Those otherwise only
+        # depend on the configuration parameter and meter identification,
+        # which stay the same for the lifetime of the instance, so are cached
+        # across calls to `process()` for instances reused over meter cycles
+        self._hass_props_cache: Dict[
+            Tuple[int, bool], Tuple[str, str, str, str]
+        ] = {}
+        self._hass_json_config_payload_cache: Dict[Tuple[int, bool], str] = {}
 
     @property
     def state_last_will_payload(self) -> Optional[str]:
@@ -85,6 +116,15 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
         """
         return None
 
+    @property
+    def config_param(self) -> ConfigParameterSchema:
+        """
+        Provides configuration parameter associated with the instance.
+
+        :return: Configuration parameter
+        """
+        return self._config_param
+
     @property
     def iec_item(self) -> List[IecDataSet]:
         """
@@ -103,33 +143,59 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
         """
         self._iec_item = value
 
-    def iec_try_value_by_index(self) -> None:
+    def iec_try_value_by_index(self) -> List[IecDataSet]:
         """
         Attempts to pick an item from multi-valued meter's response (if
         ``response_idx`` is configured in the entry of `parameters` section
         being processed).
+
+        :return: Entries of meter's response to process
         """
-        if self._config_param.response_idx is not None:
-            try:
-                self.iec_item = [
-                    self.iec_item[self._config_param.response_idx]
-                ]
-            except IndexError:
-                _LOGGER.error("Response for IEC entry at '%s' doesn't"
-                              " contain element at index '%s', skipping.\n"
-                              "Response: '%s'",
-                              self._config_param.address,
-                              self._config_param.response_idx, self.iec_item)
-                self.iec_item = []
-
-    def hass_gen_hass_sensor_props(self, idx: int) -> None:
+        if self._config_param.response_idx is None:
+            return self.iec_item
+
+        try:
+            return [self.iec_item[self._config_param.response_idx]]
+        except IndexError:
+            _LOGGER.error("Response for IEC entry at '%s' doesn't"
+                          " contain element at index '%s', skipping.\n"
+                          "Response: '%s'",
+                          self._config_param.address,
+                          self._config_param.response_idx, self.iec_item)
+            return []
+
+    def hass_gen_hass_sensor_props(
+        self, idx: int, multiple_entries: Optional[bool] = None
+    ) -> None:
         """
         Generates various properties for the HASS sensor (device and unique
         IDs, MQTT topic names etc.).
+
+        :param idx: Index of the entry in meter's response
+        :param multiple_entries: Whether meter's response has multiple entries,
+         determined from the response if not provided
         """
-        self._hass_device_id = f'{self._model}_{self._serial_number}'
-        self._hass_unique_id = f'{self._hass_device_id}' \
-            f'_{self._config_param.entity_name or self._config_param.address}'
+        if multiple_entries is None:
+            # Same as `iec_try_value_by_index()` would result in, without
+            # logging an error for missing entry - single entry is picked if
+            # `response_idx` is configured
+            multiple_entries = (
+                self._config_param.response_idx is None
+                and len(self.iec_item) > 1
+            )
+
+        props = self._hass_props_cache.get((idx, multiple_entries))
+        if props is not None:
+            (
+                self._hass_item_name, self._hass_unique_id,
+                self._hass_config_topic, self._hass_state_topic
+            ) = props
+            return
+
+        entity_id = (
+            self._config_param.entity_name or self._config_param.address
+        )
+        self._hass_unique_id = f'{self._hass_device_id}_{entity_id}'
 
         if isinstance(self._config_param.name, list):
             self._hass_item_name = self._config_param.name[0]
@@ -139,7 +205,7 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
         # Multiple addresses with likely same name, the caller has to
         # provide meaningful names for those anyways even if they are
         # different by a reason
-        if len(self.iec_item) > 1:
+        if multiple_entries:
             self._hass_unique_id += f'_{idx}'
             # Pick next name if a list has been provided
             if isinstance(self._config_param.name, list):
@@ -155,22 +221,18 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
             else:
                 self._hass_item_name += f' {idx}'
 
-        # Compose base element of MQTT topics
-        topic_base_parts = [
-            self._mqtt_topic_base,
-            self._hass_device_id, self._hass_unique_id,
-        ]
-        if self._mqtt_config.hass_discovery_prefix:
-            topic_base_parts.insert(
-                0, self._mqtt_config.hass_discovery_prefix
-            )
-        topic_base = '/'.join(topic_base_parts)
+        topic_base = f'{self._hass_topic_prefix}/{self._hass_unique_id}'
 
         # Config and state MQTT topics for HomeAssistant discovery, see
         # https://www.home-assistant.io/docs/mqtt/discovery/ for details
         self._hass_config_topic = f'{topic_base}/config'
         self._hass_state_topic = f'{topic_base}/state'
 
+        self._hass_props_cache[(idx, multiple_entries)] = (
+            self._hass_item_name, self._hass_unique_id,
+            self._hass_config_topic, self._hass_state_topic
+        )
+
     def hass_config_payload(
         self
     ) -> Dict[str, Union[str, Collection[str], Dict[str, str]]]:
@@ -189,12 +251,7 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
 
         res = dict(
             name=self._hass_item_name,
-            device=dict(
-                name=self._serial_number,
-                ids=self._hass_device_id,
-                model=self._model,
-                sw_version=self._sw_version,
-            ),
+            device=self._hass_device,
             device_class=self._config_param.device_class,
             unique_id=self._hass_unique_id,
             object_id=self._hass_unique_id,
@@ -202,7 +259,7 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
             state_class=self._config_param.state_class,
             state_topic=self._hass_state_topic,
             entity_category=self._config_param.entity_category,
-            value_template='{{ value_json.value }}',
+            value_template=HASS_VALUE_TEMPLATE,
         )
         # Skip empty values
         return {k: v for k, v in res.items() if v is not None}
@@ -219,7 +276,9 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
             value=value
         )
 
-    async def process(self, setup_only: bool = False) -> None:
+    async def process(  # pylint: disable=too-many-branches
+        self, setup_only: bool = False
+    ) -> None:
         """
         Processes the entry received from the meter and sends it to HASS over
         MQTT.
@@ -229,38 +288,52 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
          to configure MQTT last will, since it has to be done prior to
          connecting to MQTT broker, thus no payloads could be sent yet
         """
-        _LOGGER.debug("Processing entry: IEC address '%s',"
-                      " additional data '%s', index in response '%s';"
-                      " HASS name '%s', entity name '%s'",
-                      self._config_param.address,
-                      self._config_param.additional_data,
-                      self._config_param.response_idx, self._config_param.name,
-                      self._config_param.entity_name)
-
-        self.iec_try_value_by_index()
-        for idx, iec_value in enumerate(self.iec_item):
+        # Logging level is checked once, so that the debug calls below (some
+        # are done per entry on every meter cycle) are skipped entirely
+        # unless enabled
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Processing entry: IEC address '%s',"
+                          " additional data '%s', index in response '%s';"
+                          " HASS name '%s', entity name '%s'",
+                          self._config_param.address,
+                          self._config_param.additional_data,
+                          self._config_param.response_idx,
+                          self._config_param.name,
+                          self._config_param.entity_name)
+
+        iec_values = self.iec_try_value_by_index()
+        # Nothing to process
+        if not iec_values:
+            return
+        multiple_entries = len(iec_values) > 1
+        # Last will payload doesn't depend on the entry, so is formatted once
+        json_will_payload = None
+        if self.state_last_will_payload is not None:
+            json_will_payload = json.dumps(
+                self.hass_state_payload(value=self.state_last_will_payload)
+            )
+        for idx, iec_value in enumerate(iec_values):
             try:
-                self.hass_gen_hass_sensor_props(idx)
-                _LOGGER.debug("Using '%s' as HASS name for IEC enttity"
-                              " at '%s' address",
-                              self._hass_item_name, self._config_param.address)
+                self.hass_gen_hass_sensor_props(idx, multiple_entries)
+                if debug:
+                    _LOGGER.debug("Using '%s' as HASS name for IEC enttity"
+                                  " at '%s' address",
+                                  self._hass_item_name,
+                                  self._config_param.address)
                 # Set last will for MQTT if specified for the item
-                if self.state_last_will_payload is not None:
-                    will_payload = self.hass_state_payload(
-                        value=self.state_last_will_payload
-                    )
-                    json_will_payload = json.dumps(will_payload)
-
+                if json_will_payload is not None:
                     self._mqtt_client.will_set(
                         topic=self._hass_state_topic,
                         payload=json_will_payload
                     )
 
-                    _LOGGER.debug(
-                        "Set HASS state topic for MQTT last will,"
-                        " payload: '%s'",
-                        json_will_payload
-                    )
+                    if debug:
+                        _LOGGER.debug(
+                            "Set HASS state topic for MQTT last will,"
+                            " payload: '%s'",
+                            json_will_payload
+                        )
 
                 # Skip sending MQTT payloads if only setup steps have been
                 # requested
@@ -275,8 +348,18 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
                 assert self._hass_config_topic, 'HASS config topic is missing'
                 assert self._hass_state_topic, 'HASS state topic is missing'
                 # Send configuration payloads using MQTT once per sensor
-                config_payload = self.hass_config_payload()
-                json_config_payload = json.dumps(config_payload)
+                json_config_payload = (
+                    self._hass_json_config_payload_cache.get(
+                        (idx, multiple_entries)
+                    )
+                )
+                if json_config_payload is None:
+                    json_config_payload = json.dumps(
+                        self.hass_config_payload()
+                    )
+                    self._hass_json_config_payload_cache[
+                        (idx, multiple_entries)
+                    ] = json_config_payload
                 config_payload_sent_hash = (
                     self.hass_config_payloads_published.get(
                         self._hass_unique_id, None
@@ -285,9 +368,10 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
                 # (re)send the configuration payload once it changes (e.g. due
                 # to interpolation)
                 if config_payload_sent_hash != hash(json_config_payload):
-                    _LOGGER.debug("MQTT config payload for HASS"
-                                  " auto-discovery: '%s'",
-                                  json_config_payload)
+                    if debug:
+                        _LOGGER.debug("MQTT config payload for HASS"
+                                      " auto-discovery: '%s'",
+                                      json_config_payload)
 
                     await self._mqtt_client.publish(
                         topic=self._hass_config_topic,
@@ -299,26 +383,30 @@ class IecToHassSensor:  # pylint: disable=too-many-instance-attributes
                         self._hass_unique_id
                     ] = hash(json_config_payload)
 
-                    _LOGGER.debug("Sent HASS config payload to MQTT topic"
-                                  " '%s'",
-                                  self._hass_config_topic)
+                    if debug:
+                        _LOGGER.debug("Sent HASS config payload to MQTT"
+                                      " topic '%s'",
+                                      self._hass_config_topic)
 
                 # Sensor state payload
                 state_payload = self.hass_state_payload(
                     value=iec_value.value
                 )
                 json_state_payload = json.dumps(state_payload)
-                _LOGGER.debug("MQTT state payload for HASS auto-discovery:"
-                              " '%s'",
-                              json_state_payload)
+                if debug:
+                    _LOGGER.debug("MQTT state payload for HASS"
+                                  " auto-discovery: '%s'",
+                                  json_state_payload)
 
                 # Send sensor state
                 await self._mqtt_client.publish(
                     topic=self._hass_state_topic,
                     payload=json_state_payload
                 )
-                _LOGGER.debug("Sent HASS state payload to MQTT topic '%s'",
-                              self._hass_state_topic)
+                if debug:
+                    _LOGGER.debug("Sent HASS state payload to MQTT topic"
+                                  " '%s'",
+                                  self._hass_state_topic)
 
             # pylint: disable=broad-except
             except Exception as exc:
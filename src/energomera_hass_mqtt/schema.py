@@ -52,9 +52,8 @@ class ConfigGeneralSchema(BaseModel):
         """
         Validates logging level.
         """
-        valid_levels = LOGGING_LEVELS.keys()
-        if value not in valid_levels:
-            valid_levels_str = ', '.join([f"'{x}'" for x in valid_levels])
+        if value not in LOGGING_LEVELS:
+            valid_levels_str = ', '.join([f"'{x}'" for x in LOGGING_LEVELS])
             raise ValueError(
                 f'should be one of {valid_levels_str}'
             )
@@ -34,6 +34,7 @@ import pytest
 from pytest import FixtureRequest
 import iec62056_21.transports
 from energomera_hass_mqtt.mqtt_client import MqttClient
+from energomera_hass_mqtt.iec_hass_sensor import IecToHassSensor
 
 MockMqttT = Dict[str, Mock]
 MockSerialT = Dict[str, Mock]
@@ -1026,6 +1027,16 @@ CONFIG_YAML = CONFIG_YAML_BASE + '''
 '''
 
 
+@pytest.fixture(autouse=True)
+def reset_hass_config_payloads_published() -> None:
+    '''
+    Resets HASS configuration payloads sent across all instances of
+    `IecToHassSensor`, so that each test starts the same way freshly started
+    program does.
+    '''
+    IecToHassSensor.hass_config_payloads_published = {}
+
+
 @pytest.fixture
 def mock_config(request: FixtureRequest) -> Iterator[None]:
     '''
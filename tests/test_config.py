@@ -25,6 +25,7 @@ from __future__ import annotations
 # re.Match is not generic in Python 3.8, so it uses the `typing.Match` despite
 # it is deprecated since Python 3.9
 from typing import cast, Match
+from pathlib import Path
 import logging
 import re
 from freezegun import freeze_time
@@ -148,6 +149,44 @@ def test_non_existing_file() -> None:
         EnergomeraConfig(config_file='non-existent-config-file')
 
 
+NON_ASCII_CONFIG_YAML = '''
+    meter:
+      port: dummy_serial
+      password: dummy_password
+    mqtt:
+      host: a_mqtt_host
+    parameters:
+        - name: Энергия за месяц
+          address: dummy_addr
+          device_class: énergie
+'''
+
+
+def test_non_ascii_file(tmp_path: Path) -> None:
+    '''
+    Tests for processing configuration file in UTF-8 encoding, having
+    non-ASCII values.
+    '''
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_bytes(NON_ASCII_CONFIG_YAML.encode('utf-8'))
+
+    config = EnergomeraConfig(config_file=str(config_file))
+    assert config.of.parameters[0].name == 'Энергия за месяц'
+    assert config.of.parameters[0].device_class == 'énergie'
+
+
+def test_invalid_encoding_file(tmp_path: Path) -> None:
+    '''
+    Tests for processing configuration file in encoding other than supported
+    by YAML (UTF-8 or UTF-16/32 with BOM).
+    '''
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_bytes(NON_ASCII_CONFIG_YAML.encode('cp1251', 'replace'))
+
+    with pytest.raises(EnergomeraConfigError):
+        EnergomeraConfig(config_file=str(config_file))
+
+
 def test_invalid_content() -> None:
     '''
     Tests for invalid configuration content.
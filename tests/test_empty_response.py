@@ -0,0 +1,101 @@
+# Copyright (c) 2024 Ilia Sotnikov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+Tests for handling empty responses from the meter.
+'''
+import json
+import logging
+from unittest.mock import call
+import pytest
+from conftest import (
+    CONFIG_YAML_BASE, MockMqttT, MockSerialT, SERIAL_EXCHANGE_BASE
+)
+from energomera_hass_mqtt.main import main
+
+serial_exchange = SERIAL_EXCHANGE_BASE + [
+    # Response with no data sets
+    {
+        'receive_bytes': b'\x01R1\x02ECMPE()\x03C',
+        'send_bytes': b'\x02\x03\x03',
+    },
+    {
+        'receive_bytes': b'\x01R1\x02ET0PE()\x037',
+        'send_bytes': b'\x02ET0PE(100.5)\r\nET0PE(0.0)\r\n\x03\x11',
+    },
+]
+
+CONFIG_YAML = CONFIG_YAML_BASE + '''
+    parameters:
+        - address: ECMPE
+          name: Monthly energy
+          response_idx: 0
+        - address: ET0PE
+          name: Cumulative energy
+          response_idx: 0
+'''
+
+
+@pytest.mark.usefixtures('mock_config')
+@pytest.mark.config_yaml(CONFIG_YAML)
+@pytest.mark.serial_exchange(serial_exchange)
+def test_empty_response(
+    mock_serial: MockSerialT, mock_mqtt: MockMqttT,
+    caplog: pytest.LogCaptureFixture
+) -> None:
+    '''
+    Tests for parameter with empty response from the meter to be skipped
+    without warnings, while subsequent parameters are still processed.
+    '''
+    with caplog.at_level(logging.DEBUG):
+        main()
+
+    mock_serial['_send'].assert_has_calls(
+        [call(x['receive_bytes']) for x in serial_exchange]
+    )
+
+    # Nothing should be sent to MQTT for the parameter with empty response
+    assert not [
+        x for x in mock_mqtt['publish'].call_args_list
+        if 'CE301_00123456_ECMPE' in x.kwargs['topic']
+    ]
+
+    mock_mqtt['publish'].assert_has_calls([
+        call(
+            topic='homeassistant/sensor/CE301_00123456'
+            '/CE301_00123456_ET0PE/state',
+            payload=json.dumps({'value': '100.5'}),
+        ),
+        call(
+            topic='homeassistant/binary_sensor/CE301_00123456'
+            '/CE301_00123456_IS_ONLINE/state',
+            payload=json.dumps({'value': 'ON'}),
+        ),
+    ], any_order=True)
+
+    # The empty response is only logged at debug level, since it would
+    # likely repeat on every meter cycle
+    no_data_records = [
+        x for x in caplog.records
+        if "No data received from meter for IEC entry at 'ECMPE'" in
+        x.getMessage()
+    ]
+    assert no_data_records
+    assert all(x.levelno == logging.DEBUG for x in no_data_records)
@@ -29,6 +29,7 @@ from conftest import (
     MockSerialT
 )
 from energomera_hass_mqtt.main import main
+from energomera_hass_mqtt.hass_mqtt import EnergomeraHassMqtt
 
 
 @pytest.mark.usefixtures('mock_config')
@@ -83,3 +84,20 @@ def test_timeout() -> None:
     Tests for timeout handling, no unhandled exceptions should be raised.
     '''
     main()
+
+
+@pytest.mark.parametrize('frame', [
+    # Frames sent to the meter, BCC is calculated over the data following SOH
+    x['receive_bytes'] for x in SERIAL_EXCHANGE_COMPLETE
+    if x['receive_bytes'].startswith(b'\x01')
+] + [
+    # Frames received from the meter, BCC is calculated over the data
+    # following STX
+    x['send_bytes'] for x in SERIAL_EXCHANGE_COMPLETE
+    if x['send_bytes'].startswith(b'\x02')
+])
+def test_calculate_bcc(frame: bytes) -> None:
+    '''
+    Tests for BCC calculation over protocol frames.
+    '''
+    assert EnergomeraHassMqtt.calculate_bcc(frame[1:-1]) == frame[-1:]
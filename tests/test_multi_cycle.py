@@ -0,0 +1,135 @@
+# Copyright (c) 2024 Ilia Sotnikov
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+Tests for running the program multiple times within single process.
+'''
+from typing import List
+import asyncio
+import json
+from unittest.mock import call
+import pytest
+from freezegun import freeze_time
+from conftest import (
+    CONFIG_YAML_BASE, MockMqttT, MockSerialT, SERIAL_EXCHANGE_BASE
+)
+from energomera_hass_mqtt.main import async_main
+
+# Ending the session with the meter, which has no response
+serial_exchange_break = [
+    {
+        'receive_bytes': b'\x01B0\x03u',
+        'send_bytes': b'',
+    },
+]
+# Meter responses for the meter present initially, and the one it is replaced
+# with before the last run
+serial_exchange_meter = SERIAL_EXCHANGE_BASE + [
+    {
+        'receive_bytes': b'\x01R1\x02ET0PE()\x037',
+        'send_bytes': b'\x02ET0PE(100.5)\r\nET0PE(0.0)\r\n\x03\x11',
+    },
+] + serial_exchange_break
+serial_exchange_replaced_meter = SERIAL_EXCHANGE_BASE[:-1] + [
+    {
+        'receive_bytes': b'\x01R1\x02HELLO()\x03M',
+        'send_bytes': b'\x02HELLO(2,CE301,12,00654321,dummy)\r\n\x03\x01',
+    },
+    {
+        'receive_bytes': b'\x01R1\x02ET0PE()\x037',
+        'send_bytes': b'\x02ET0PE(200.5)\r\nET0PE(0.0)\r\n\x03\x12',
+    },
+] + serial_exchange_break
+
+# Runs performed by the test:
+# 1. Initial one, configuration payload is sent
+# 2. Steady state, nothing has changed so configuration payload isn't sent
+# 3. Date has changed, so configuration payload with interpolated name is sent
+#    again
+# 4. Meter has been replaced, so the sensors are set up for the new one
+serial_exchange = (
+    serial_exchange_meter * 3 + serial_exchange_replaced_meter
+)
+
+CONFIG_YAML = CONFIG_YAML_BASE + '''
+    parameters:
+        - address: ET0PE
+          name: 'Cumulative energy {{ energomera_prev_month }}'
+          response_idx: 0
+'''
+
+
+@pytest.mark.usefixtures('mock_config')
+@pytest.mark.config_yaml(CONFIG_YAML)
+@pytest.mark.serial_exchange(serial_exchange)
+def test_multi_cycle(
+    mock_serial: MockSerialT, mock_mqtt: MockMqttT
+) -> None:
+    '''
+    Tests for configuration payloads to be sent only when changed across
+    multiple runs, and for the sensors to follow the meter being replaced.
+    '''
+    with freeze_time('2022-05-10') as frozen_date:
+        asyncio.run(async_main())
+        asyncio.run(async_main())
+        frozen_date.move_to('2022-06-10')
+        asyncio.run(async_main())
+        asyncio.run(async_main())
+
+    mock_serial['_send'].assert_has_calls(
+        [call(x['receive_bytes']) for x in serial_exchange]
+    )
+
+    def published(topic: str) -> List[str]:
+        return [
+            x.kwargs['payload'] for x in mock_mqtt['publish'].call_args_list
+            if x.kwargs['topic'] == topic
+        ]
+
+    # Configuration payloads for initial meter - sent on first run and
+    # once the interpolated name changes
+    assert [
+        json.loads(x)['name'] for x in published(
+            'homeassistant/sensor/CE301_00123456'
+            '/CE301_00123456_ET0PE/config'
+        )
+    ] == ['Cumulative energy 04.22', 'Cumulative energy 05.22']
+    assert published(
+        'homeassistant/sensor/CE301_00123456/CE301_00123456_ET0PE/state'
+    ) == [json.dumps({'value': '100.5'})] * 3
+    assert len(published(
+        'homeassistant/binary_sensor/CE301_00123456'
+        '/CE301_00123456_IS_ONLINE/config'
+    )) == 1
+
+    # The replaced meter gets its own sensors
+    assert [
+        json.loads(x)['name'] for x in published(
+            'homeassistant/sensor/CE301_00654321'
+            '/CE301_00654321_ET0PE/config'
+        )
+    ] == ['Cumulative energy 05.22']
+    assert published(
+        'homeassistant/sensor/CE301_00654321/CE301_00654321_ET0PE/state'
+    ) == [json.dumps({'value': '200.5'})]
+    assert len(published(
+        'homeassistant/binary_sensor/CE301_00654321'
+        '/CE301_00654321_IS_ONLINE/config'
+    )) == 1